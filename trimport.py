@@ -5,19 +5,23 @@ import hashlib
 import os
 import re
 import sqlite3
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Sequence, Tuple
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import Iterator, List, Optional, Sequence, Tuple
 import json
 
 
 DATE_PATTERN = re.compile(r"\b(\d{1,2}\.\d{1,2}\.\d{4})\b")
 DATE_WORD_PATTERN = re.compile(
-    r"\b(\d{1,2})\s+([A-Za-zÄÖÜäöüß\.]+)\s+(\d{4})\b",
+    r"\b(\d{1,2})\s+([A-Za-zÄÖÜäöüß]+)\.?\s+(\d{4})\b",
     re.IGNORECASE,
 )
 ISIN_PATTERN = re.compile(r"\b([A-Z]{2}[A-Z0-9]{10})\b")
 AMOUNT_PATTERN = re.compile(r"(-?\d{1,3}(?:\.\d{3})*,\d{2})")
+QUANTITY_PATTERN = re.compile(r"\b(\d+(?:[.,]\d+)?)\b")
 
 TYPE_MAP = {
     "kauf": "buy",
@@ -32,6 +36,24 @@ TYPE_MAP = {
     "handel": "trade",
 }
 
+_TYPE_ALTERNATION = "|".join(sorted(map(re.escape, TYPE_MAP), key=len, reverse=True))
+
+# Single scan over a transaction line: every type keyword, ISIN and amount is
+# collected in one pass instead of one regex walk per field.
+LINE_RE = re.compile(
+    r"(?i:\b(?P<type>" + _TYPE_ALTERNATION + r")\b)"
+    r"|(?P<isin>" + ISIN_PATTERN.pattern + r")"
+    r"|(?P<amount>" + AMOUNT_PATTERN.pattern + r")"
+)
+
+# Pre-bound methods of the patterns used once or more per line: saves the
+# attribute lookup on every call in the parse hot path.
+_DATE_SEARCH = DATE_PATTERN.search
+_DATE_MATCH = DATE_PATTERN.match
+_DATE_WORD_SEARCH = DATE_WORD_PATTERN.search
+_LINE_FINDITER = LINE_RE.finditer
+_QUANTITY_SEARCH = QUANTITY_PATTERN.search
+
 HEADER_TOKENS = [
     "DATUM",
     "TYP",
@@ -41,6 +63,19 @@ HEADER_TOKENS = [
     "SALDO",
 ]
 
+# Finds the table header line in one scan over the page text: every token
+# must appear somewhere on the same line, in any order. Longest (rarest)
+# tokens are tested first so ordinary lines fail on the first lookahead.
+HEADER_RE = re.compile(
+    "^"
+    + "".join(
+        f"(?=.*{re.escape(token)})"
+        for token in sorted(HEADER_TOKENS, key=len, reverse=True)
+    )
+    + ".*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 MONTH_MAP = {
     "jan": 1,
     "januar": 1,
@@ -71,7 +106,7 @@ MONTH_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     transactions: List["ParsedTransaction"]
     section_found: bool
@@ -80,7 +115,7 @@ class ParseResult:
     header_hits: dict
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedTransaction:
     date: str
     txn_type: str
@@ -91,7 +126,7 @@ class ParsedTransaction:
     amount_out: Optional[float]
     balance: Optional[float]
     source_pdf: str
-    txn_hash: str
+    txn_hash: bytes
 
 
 SCHEMA_SQL = """
@@ -102,6 +137,13 @@ CREATE TABLE IF NOT EXISTS documents (
     scanned_at TEXT NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS document_stat (
+    source_pdf TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    checksum TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS transactions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     document_id INTEGER NOT NULL,
@@ -114,136 +156,173 @@ CREATE TABLE IF NOT EXISTS transactions (
     amount_out REAL,
     balance REAL,
     source_pdf TEXT NOT NULL,
-    txn_hash TEXT NOT NULL UNIQUE,
+    txn_hash BLOB NOT NULL UNIQUE,
     created_at TEXT NOT NULL,
     FOREIGN KEY(document_id) REFERENCES documents(id)
 );
+
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date, id);
 """
 
 
+def connect_db(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA wal_autocheckpoint=1000")
+    return conn
+
+
 def init_db(db_path: str) -> None:
     os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
-    with sqlite3.connect(db_path) as conn:
+    conn = connect_db(db_path)
+    try:
         conn.executescript(SCHEMA_SQL)
         conn.commit()
+    finally:
+        conn.close()
+
+
+_AMOUNT_TABLE = str.maketrans({".": None, ",": "."})
 
 
 def parse_amount(value: str) -> float:
-    normalized = value.replace(".", "").replace(",", ".")
-    return float(normalized)
+    return float(value.translate(_AMOUNT_TABLE))
 
 
+@lru_cache(maxsize=4096)
 def normalize_date(date_value: str) -> str:
-    return datetime.strptime(date_value, "%d.%m.%Y").date().isoformat()
+    day, month, year = date_value.split(".")
+    return f"{year}-{int(month):02d}-{int(day):02d}"
 
 
+@lru_cache(maxsize=256)
 def normalize_word_month(month_value: str) -> Optional[int]:
-    cleaned = month_value.strip(".").lower()
-    return MONTH_MAP.get(cleaned)
+    return MONTH_MAP.get(month_value.lower())
+
+
+def _strip_span(text: str, start: int, end: int) -> str:
+    # Dates sit at the edge of the line in practice; slice instead of
+    # concatenating two copies when they do.
+    if start == 0:
+        return text[end:].strip()
+    if end == len(text):
+        return text[:start].strip()
+    return (text[:start] + text[end:]).strip()
 
 
 def extract_date(text: str) -> Tuple[Optional[str], str]:
-    match = DATE_PATTERN.search(text)
+    match = _DATE_SEARCH(text)
     if match:
         date_iso = normalize_date(match.group(1))
-        stripped = text[: match.start()] + text[match.end() :]
-        return date_iso, stripped.strip()
+        return date_iso, _strip_span(text, match.start(), match.end())
 
-    match = DATE_WORD_PATTERN.search(text)
+    match = _DATE_WORD_SEARCH(text)
     if match:
         day = int(match.group(1))
         month = normalize_word_month(match.group(2))
         year = int(match.group(3))
         if month:
-            date_iso = datetime(year, month, day).date().isoformat()
-            stripped = text[: match.start()] + text[match.end() :]
-            return date_iso, stripped.strip()
+            date_iso = f"{year:04d}-{month:02d}-{day:02d}"
+            return date_iso, _strip_span(text, match.start(), match.end())
 
     return None, text.strip()
 
 
-def extract_amounts(text: str) -> List[float]:
-    matches = AMOUNT_PATTERN.findall(text)
-    return [parse_amount(match) for match in matches]
-
-
-def extract_quantity(description: str, isin_match: Optional[re.Match]) -> Optional[float]:
-    search_text = description
-    if isin_match:
-        search_text = description[isin_match.end() :]
-    matches = re.findall(r"\b(\d+(?:[.,]\d+)?)\b", search_text)
-    if not matches:
+def extract_quantity(search_text: str) -> Optional[float]:
+    match = _QUANTITY_SEARCH(search_text)
+    if not match:
         return None
-    candidate = matches[0]
+    candidate = match.group(1)
     if "," in candidate:
         return float(candidate.replace(",", "."))
     return float(candidate)
 
 
+NORM_DESC_RE = re.compile(r"^(?:buy trade|sell trade|buy|sell)\b\s*", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
 def normalize_description(description: str) -> str:
-    lowered = description.lower()
-    for prefix in ("buy trade", "sell trade", "buy", "sell"):
-        if lowered.startswith(prefix):
-            return description[len(prefix) :].strip()
-    return description
+    return NORM_DESC_RE.sub("", description, count=1)
 
 
-def build_txn_hash(parts: Sequence[Optional[str]]) -> str:
-    raw = "|".join([p or "" for p in parts])
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+def make_hash_seed(source_pdf: str) -> "hashlib.blake2b":
+    # The source path is common to every transaction in a document; encode
+    # and absorb it once, then copy() the context per transaction.
+    seed = hashlib.blake2b(digest_size=16)
+    seed.update(source_pdf.encode("utf-8"))
+    return seed
 
 
-def find_header_idx(lines: List[str]) -> Optional[int]:
-    for idx, line in enumerate(lines):
-        upper = line.upper()
-        if all(token in upper for token in HEADER_TOKENS):
-            return idx
-    return None
+def build_txn_hash(seed: "hashlib.blake2b", parts: Sequence[Optional[str]]) -> bytes:
+    hasher = seed.copy()
+    hasher.update(b"|")
+    hasher.update(b"|".join(p.encode("utf-8") if p else b"" for p in parts))
+    return hasher.digest()
 
 
 def extract_transaction_lines_from_text(text: str) -> Tuple[List[str], bool]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    header_idx = find_header_idx(lines)
-    if header_idx is None:
+    match = HEADER_RE.search(text)
+    if match is None:
         return [], False
-    return lines[header_idx + 1 :], True
+    lines = [ln.strip() for ln in text[match.end() :].splitlines() if ln.strip()]
+    return lines, True
 
 
 def parse_transaction_lines(lines: List[str], source_pdf: str) -> List[ParsedTransaction]:
     transactions: List[ParsedTransaction] = []
     buffer: List[str] = []
+    hash_seed = make_hash_seed(source_pdf)
     for line in lines:
+        if buffer and _DATE_MATCH(line):
+            # A new dated row is starting while the buffered one never
+            # parsed; drop the stale lines instead of merging rows.
+            buffer.clear()
         buffer.append(line)
-        combined = " ".join(buffer)
-        parsed = parse_transaction_line(combined, source_pdf)
+        # An amount (always "x,yz") is mandatory for a parse to succeed and
+        # rows end with their amounts, so lines without a comma can never
+        # complete the buffered row — skip the parse attempt entirely.
+        if "," not in line:
+            continue
+        parsed = parse_transaction_line(" ".join(buffer), source_pdf, hash_seed)
         if parsed:
             transactions.append(parsed)
             buffer.clear()
     return transactions
 
 
-def parse_transaction_line(line: str, source_pdf: str) -> Optional[ParsedTransaction]:
+def parse_transaction_line(
+    line: str,
+    source_pdf: str,
+    hash_seed: Optional["hashlib.blake2b"] = None,
+) -> Optional[ParsedTransaction]:
     date_iso, remainder = extract_date(line)
     if not date_iso:
         return None
 
-    lower_line = remainder.lower()
-    txn_type_key = None
-    type_match = None
-    for key in sorted(TYPE_MAP, key=len, reverse=True):
-        match = re.search(rf"\b{re.escape(key)}\b", lower_line)
-        if match:
-            txn_type_key = key
+    type_match: Optional[re.Match] = None
+    isin_matches: List[re.Match] = []
+    amount_matches: List[re.Match] = []
+    for match in _LINE_FINDITER(remainder):
+        group = match.lastgroup
+        if group == "amount":
+            amount_matches.append(match)
+        elif group == "isin":
+            isin_matches.append(match)
+        elif type_match is None:
             type_match = match
-            break
-    if not txn_type_key or not type_match:
+
+    if not type_match:
         return None
 
+    txn_type_key = type_match.group("type").lower()
     txn_type = TYPE_MAP[txn_type_key]
-    description = remainder[type_match.end() :].strip()
 
     if txn_type_key == "handel":
-        desc_lower = description.lower()
+        desc_lower = remainder[type_match.end() :].lower()
         if "buy" in desc_lower:
             txn_type = "buy"
         elif "sell" in desc_lower:
@@ -251,9 +330,9 @@ def parse_transaction_line(line: str, source_pdf: str) -> Optional[ParsedTransac
         else:
             txn_type = "transfer"
 
-    amounts = extract_amounts(remainder)
-    if not amounts:
+    if not amount_matches:
         return None
+    amounts = [parse_amount(match.group("amount")) for match in amount_matches]
 
     balance = None
     amount_in = None
@@ -277,25 +356,31 @@ def parse_transaction_line(line: str, source_pdf: str) -> Optional[ParsedTransac
     else:
         balance = amounts[-1]
 
-    amount_start = AMOUNT_PATTERN.search(remainder)
-    description_only = description
-    if amount_start:
-        description_only = remainder[: amount_start.start()].strip()
-        if type_match:
-            description_only = remainder[type_match.end() : amount_start.start()].strip()
+    desc_start = type_match.end()
+    desc_end = amount_matches[0].start()
+    description_only = normalize_description(remainder[desc_start:desc_end].strip())
 
-    description_only = normalize_description(description_only)
-    isin_match = ISIN_PATTERN.search(description_only)
-    isin_value = isin_match.group(1) if isin_match else None
+    isin_match = None
+    for match in isin_matches:
+        if desc_start <= match.start() and match.end() <= desc_end:
+            isin_match = match
+            break
+    isin_value = isin_match.group("isin") if isin_match else None
 
-    instrument_name = description_only
     if isin_match:
-        instrument_name = description_only[: isin_match.start()].strip()
+        instrument_name = normalize_description(remainder[desc_start : isin_match.start()].strip())
+        quantity_text = remainder[isin_match.end() : desc_end]
+    else:
+        instrument_name = description_only
+        quantity_text = description_only
     instrument_name = instrument_name or None
 
-    quantity = extract_quantity(description_only, isin_match)
+    quantity = extract_quantity(quantity_text)
 
+    if hash_seed is None:
+        hash_seed = make_hash_seed(source_pdf)
     txn_hash = build_txn_hash(
+        hash_seed,
         [
             date_iso,
             txn_type,
@@ -305,8 +390,7 @@ def parse_transaction_line(line: str, source_pdf: str) -> Optional[ParsedTransac
             str(amount_in) if amount_in is not None else None,
             str(amount_out) if amount_out is not None else None,
             str(balance) if balance is not None else None,
-            source_pdf,
-        ]
+        ],
     )
 
     return ParsedTransaction(
@@ -329,32 +413,64 @@ def extract_transactions_from_text(text: str, source_pdf: str) -> Tuple[List[Par
     return transactions, header_found
 
 
-def extract_transaction_lines_from_pdf(pdf_path: str) -> Tuple[List[str], bool, List[str], dict]:
+def _iter_page_texts(pdf_path: str) -> Iterator[str]:
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                yield text
+        finally:
+            pdf.close()
+        return
+
     import pdfplumber
 
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            # pdfplumber keeps per-page layout objects cached until the PDF
+            # closes; drop them now that the text is out.
+            page.flush_cache()
+            yield text
+
+
+def extract_transaction_lines_from_pdf(
+    pdf_path: str, capture_text: bool = True
+) -> Tuple[List[str], bool, List[str], dict]:
     all_lines: List[str] = []
     page_texts: List[str] = []
     header_found = False
     header_hits = {"hit": [], "miss": []}
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page_index, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text() or ""
+    for page_index, text in enumerate(_iter_page_texts(pdf_path), start=1):
+        if capture_text:
             page_texts.append(text)
-            lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-            header_idx = find_header_idx(lines)
-            if header_idx is None:
-                header_hits["miss"].append(page_index)
-                continue
-            header_found = True
-            header_hits["hit"].append(page_index)
-            all_lines.extend(lines[header_idx + 1 :])
+        match = HEADER_RE.search(text)
+        if match is None:
+            header_hits["miss"].append(page_index)
+            continue
+        header_found = True
+        header_hits["hit"].append(page_index)
+        all_lines.extend(
+            ln.strip() for ln in text[match.end() :].splitlines() if ln.strip()
+        )
 
     return all_lines, header_found, page_texts, header_hits
 
 
-def parse_pdf(pdf_path: str) -> ParseResult:
-    lines, header_found, page_texts, header_hits = extract_transaction_lines_from_pdf(pdf_path)
+def parse_pdf(pdf_path: str, capture_text: bool = True) -> ParseResult:
+    lines, header_found, page_texts, header_hits = extract_transaction_lines_from_pdf(
+        pdf_path, capture_text
+    )
     transactions = parse_transaction_lines(lines, pdf_path)
     return ParseResult(
         transactions=transactions,
@@ -366,67 +482,106 @@ def parse_pdf(pdf_path: str) -> ParseResult:
 
 
 def compute_checksum(path: str) -> str:
-    hasher = hashlib.sha256()
     with open(path, "rb") as file:
-        for chunk in iter(lambda: file.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def upsert_document(conn: sqlite3.Connection, source_pdf: str, checksum: str) -> int:
+    # The no-op DO UPDATE makes the conflicting row visible to RETURNING,
+    # folding the insert and the id lookup into one statement.
+    row = conn.execute(
+        "INSERT INTO documents (source_pdf, checksum, scanned_at) VALUES (?, ?, ?) "
+        "ON CONFLICT(checksum) DO UPDATE SET checksum = checksum RETURNING id",
+        (source_pdf, checksum, datetime.utcnow().isoformat(timespec="seconds")),
+    ).fetchone()
+    return int(row[0])
+
+
+# Matches the txn_stage column order below (document_id is appended last).
+_STAGE_ROW = attrgetter(
+    "txn_hash",
+    "date",
+    "txn_type",
+    "isin",
+    "instrument_name",
+    "quantity",
+    "amount_in",
+    "amount_out",
+    "balance",
+    "source_pdf",
+)
 
+# Module-level SQL constants: the sqlite3 statement cache keys on the SQL
+# text, so passing the same object every call guarantees the compiled
+# statements are reused across documents within a scan.
+STAGE_TABLE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS txn_stage (
+    txn_hash BLOB PRIMARY KEY,
+    date TEXT NOT NULL,
+    type TEXT NOT NULL,
+    isin TEXT,
+    instrument_name TEXT,
+    quantity REAL,
+    amount_in REAL,
+    amount_out REAL,
+    balance REAL,
+    source_pdf TEXT NOT NULL,
+    document_id INTEGER NOT NULL
+) WITHOUT ROWID
+"""
 
-def upsert_document(db_path: str, source_pdf: str, checksum: str) -> int:
-    with sqlite3.connect(db_path) as conn:
-        conn.execute(
-            "INSERT OR IGNORE INTO documents (source_pdf, checksum, scanned_at) VALUES (?, ?, ?)",
-            (source_pdf, checksum, datetime.utcnow().isoformat(timespec="seconds")),
-        )
-        row = conn.execute("SELECT id FROM documents WHERE checksum = ?", (checksum,)).fetchone()
-        conn.commit()
-        return int(row[0])
+STAGE_INSERT_SQL = "INSERT OR IGNORE INTO txn_stage VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+INSERT_TXN_SQL = """
+INSERT INTO transactions (
+    document_id,
+    date,
+    type,
+    isin,
+    instrument_name,
+    quantity,
+    amount_in,
+    amount_out,
+    balance,
+    source_pdf,
+    txn_hash,
+    created_at
+)
+SELECT
+    stage.document_id,
+    stage.date,
+    stage.type,
+    stage.isin,
+    stage.instrument_name,
+    stage.quantity,
+    stage.amount_in,
+    stage.amount_out,
+    stage.balance,
+    stage.source_pdf,
+    stage.txn_hash,
+    strftime('%Y-%m-%dT%H:%M:%S', 'now')
+FROM txn_stage AS stage
+WHERE NOT EXISTS (
+    SELECT 1 FROM transactions WHERE transactions.txn_hash = stage.txn_hash
+)
+"""
 
 
-def insert_transactions(db_path: str, document_id: int, transactions: Sequence[ParsedTransaction]) -> int:
+def insert_transactions(conn: sqlite3.Connection, document_id: int, transactions: Sequence[ParsedTransaction]) -> int:
     if not transactions:
         return 0
 
-    with sqlite3.connect(db_path) as conn:
-        now = datetime.utcnow().isoformat(timespec="seconds")
-        conn.executemany(
-            """
-            INSERT OR IGNORE INTO transactions (
-                document_id,
-                date,
-                type,
-                isin,
-                instrument_name,
-                quantity,
-                amount_in,
-                amount_out,
-                balance,
-                source_pdf,
-                txn_hash,
-                created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                (
-                    document_id,
-                    txn.date,
-                    txn.txn_type,
-                    txn.isin,
-                    txn.instrument_name,
-                    txn.quantity,
-                    txn.amount_in,
-                    txn.amount_out,
-                    txn.balance,
-                    txn.source_pdf,
-                    txn.txn_hash,
-                    now,
-                )
-                for txn in transactions
-            ],
-        )
-        conn.commit()
-        return conn.total_changes
+    # Stage the batch in a temp table and anti-join against the main table:
+    # duplicate rows are filtered before they touch the transactions b-tree
+    # or the WAL, instead of per-row INSERT OR IGNORE conflict handling.
+    conn.execute(STAGE_TABLE_SQL)
+    conn.execute("DELETE FROM txn_stage")
+    conn.executemany(
+        STAGE_INSERT_SQL,
+        (_STAGE_ROW(txn) + (document_id,) for txn in transactions),
+    )
+    cursor = conn.execute(INSERT_TXN_SQL)
+    return cursor.rowcount
 
 
 def write_debug_dump(
@@ -451,63 +606,161 @@ def write_debug_dump(
         json.dump(header_hits, handle, ensure_ascii=False, indent=2)
 
 
+COMMIT_EVERY = 50
+
+
+def _parse_worker(pdf_path: str, capture_text: bool = True) -> ParseResult:
+    return parse_pdf(pdf_path, capture_text)
+
+
+def _iter_parse_results(
+    pdf_paths: List[str], workers: int, capture_text: bool = True
+) -> Iterator[Tuple[str, ParseResult]]:
+    worker = partial(_parse_worker, capture_text=capture_text)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from zip(pdf_paths, executor.map(worker, pdf_paths))
+    else:
+        for pdf_path in pdf_paths:
+            yield pdf_path, worker(pdf_path)
+
+
+def already_indexed(conn: sqlite3.Connection, checksum: str) -> Optional[int]:
+    row = conn.execute("SELECT id FROM documents WHERE checksum = ?", (checksum,)).fetchone()
+    return int(row[0]) if row else None
+
+
+def _stat_cached_checksum(
+    conn: sqlite3.Connection, pdf_path: str, stat: os.stat_result
+) -> Optional[str]:
+    row = conn.execute(
+        "SELECT mtime_ns, size, checksum FROM document_stat WHERE source_pdf = ?",
+        (pdf_path,),
+    ).fetchone()
+    if row and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+        return str(row[2])
+    return None
+
+
+def _store_checksum(
+    conn: sqlite3.Connection, pdf_path: str, stat: os.stat_result, checksum: str
+) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO document_stat (source_pdf, mtime_ns, size, checksum) "
+        "VALUES (?, ?, ?, ?)",
+        (pdf_path, stat.st_mtime_ns, stat.st_size, checksum),
+    )
+
+
+def resolve_checksums(conn: sqlite3.Connection, pdf_paths: Sequence[str]) -> dict:
+    checksums = {}
+    pending = []
+    # A single hashing thread reads and digests the next uncached file while
+    # the main thread keeps issuing the stat-cache lookups.
+    with ThreadPoolExecutor(max_workers=1) as hasher:
+        for pdf_path in pdf_paths:
+            stat = os.stat(pdf_path)
+            cached = _stat_cached_checksum(conn, pdf_path, stat)
+            if cached is not None:
+                checksums[pdf_path] = cached
+            else:
+                pending.append((pdf_path, stat, hasher.submit(compute_checksum, pdf_path)))
+        for pdf_path, stat, future in pending:
+            checksum = future.result()
+            _store_checksum(conn, pdf_path, stat, checksum)
+            checksums[pdf_path] = checksum
+    return checksums
+
+
+def _store_result(
+    conn: sqlite3.Connection,
+    pdf_path: str,
+    checksum: str,
+    result: ParseResult,
+    debug_dump: Optional[str],
+) -> int:
+    document_id = upsert_document(conn, pdf_path, checksum)
+    if debug_dump:
+        write_debug_dump(
+            debug_dump,
+            pdf_path,
+            result.page_texts,
+            result.extracted_lines,
+            result.header_hits,
+        )
+    inserted_count = insert_transactions(conn, document_id, result.transactions)
+    print(
+        f"{pdf_path}: found {len(result.transactions)} transactions, "
+        f"inserted {inserted_count} new."
+    )
+    if len(result.transactions) == 0:
+        header_hits = result.header_hits
+        hits = len(header_hits.get("hit", []))
+        misses = len(header_hits.get("miss", []))
+        print(
+            f"{pdf_path}: header found: "
+            f"{'yes' if result.section_found else 'no'}."
+        )
+        print(f"{pdf_path}: header hits {hits}, misses {misses}.")
+    return inserted_count
+
+
+def iter_pdfs(root: str) -> Iterator[str]:
+    # os.scandir keeps the type information from the directory read, so
+    # no extra stat call is needed per entry.
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        # Match os.walk's default: skip unreadable directories instead of
+        # aborting the scan.
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_pdfs(entry.path)
+        elif entry.is_file() and entry.name.lower().endswith(".pdf"):
+            yield entry.path
+
+
 def scan_folder(folder: str, db_path: str, debug_dump: Optional[str]) -> int:
     init_db(db_path)
     inserted = 0
-    for root, _, files in os.walk(folder):
-        for filename in files:
-            if not filename.lower().endswith(".pdf"):
-                continue
-            pdf_path = os.path.join(root, filename)
-            checksum = compute_checksum(pdf_path)
-            document_id = upsert_document(db_path, pdf_path, checksum)
-            result = parse_pdf(pdf_path)
-            if debug_dump:
-                write_debug_dump(
-                    debug_dump,
-                    pdf_path,
-                    result.page_texts,
-                    result.extracted_lines,
-                    result.header_hits,
+    pdf_paths = list(iter_pdfs(folder))
+
+    conn = connect_db(db_path)
+    try:
+        with conn:
+            checksums = resolve_checksums(conn, pdf_paths)
+            to_parse: List[str] = []
+            for pdf_path in pdf_paths:
+                document_id = already_indexed(conn, checksums[pdf_path])
+                if (
+                    debug_dump is None
+                    and document_id is not None
+                    and conn.execute(
+                        "SELECT 1 FROM transactions WHERE document_id = ? LIMIT 1",
+                        (document_id,),
+                    ).fetchone()
+                ):
+                    print(f"{pdf_path}: already imported, skipping parse.")
+                    continue
+                to_parse.append(pdf_path)
+
+            workers = min(os.cpu_count() or 1, len(to_parse), 8)
+            for processed, (pdf_path, result) in enumerate(
+                _iter_parse_results(to_parse, workers, debug_dump is not None), start=1
+            ):
+                inserted += _store_result(
+                    conn, pdf_path, checksums[pdf_path], result, debug_dump
                 )
-            inserted_count = insert_transactions(db_path, document_id, result.transactions)
-            inserted += inserted_count
-            print(
-                f"{pdf_path}: found {len(result.transactions)} transactions, "
-                f"inserted {inserted_count} new."
-            )
-            if len(result.transactions) == 0:
-                header_hits = result.header_hits
-                hits = len(header_hits.get("hit", []))
-                misses = len(header_hits.get("miss", []))
-                print(
-                    f"{pdf_path}: header found: "
-                    f"{'yes' if result.section_found else 'no'}."
-                )
-                print(f"{pdf_path}: header hits {hits}, misses {misses}.")
+                if processed % COMMIT_EVERY == 0:
+                    conn.commit()
+    finally:
+        conn.execute("PRAGMA optimize")
+        conn.close()
     return inserted
 
 
-def export_rows(db_path: str, output_path: str, fmt: str) -> int:
-    with sqlite3.connect(db_path) as conn:
-        cursor = conn.execute(
-            """
-            SELECT
-                date,
-                type,
-                isin,
-                instrument_name,
-                quantity,
-                amount_in,
-                amount_out,
-                balance,
-                source_pdf
-            FROM transactions
-            ORDER BY date, id
-            """,
-        )
-        rows = cursor.fetchall()
-
+def export_rows(db_path: str, output_path: str, fmt: str, limit: Optional[int] = None) -> int:
     headers = [
         "date",
         "type",
@@ -521,24 +774,50 @@ def export_rows(db_path: str, output_path: str, fmt: str) -> int:
     ]
 
     os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    exported = 0
 
-    if fmt == "csv":
-        with open(output_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(headers)
-            writer.writerows(rows)
-    elif fmt == "xlsx":
-        from openpyxl import Workbook
-
-        workbook = Workbook()
-        sheet = workbook.active
-        sheet.append(headers)
-        for row in rows:
-            sheet.append(list(row))
-        workbook.save(output_path)
-    else:
-        raise ValueError(f"Unsupported format: {fmt}")
-    return len(rows)
+    sql = """
+        SELECT
+            date,
+            type,
+            isin,
+            instrument_name,
+            quantity,
+            amount_in,
+            amount_out,
+            balance,
+            source_pdf
+        FROM transactions
+        ORDER BY date, id
+    """
+    params: Tuple = ()
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = (limit,)
+
+    with sqlite3.connect(db_path) as conn:
+        cursor = conn.execute(sql, params)
+
+        if fmt == "csv":
+            with open(output_path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(headers)
+                for row in cursor:
+                    writer.writerow(row)
+                    exported += 1
+        elif fmt == "xlsx":
+            from openpyxl import Workbook
+
+            workbook = Workbook(write_only=True)
+            sheet = workbook.create_sheet()
+            sheet.append(headers)
+            for row in cursor:
+                sheet.append(list(row))
+                exported += 1
+            workbook.save(output_path)
+        else:
+            raise ValueError(f"Unsupported format: {fmt}")
+    return exported
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -558,6 +837,12 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     export_parser.add_argument("--format", choices=["csv", "xlsx"], required=True)
     export_parser.add_argument("--out", required=True, help="Output file path.")
     export_parser.add_argument("--db", default="trade_republic.db", help="SQLite database path.")
+    export_parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Export at most this many rows.",
+    )
 
     return parser.parse_args(argv)
 
@@ -569,7 +854,7 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         inserted = scan_folder(args.folder, args.db, args.debug_dump)
         print(f"Inserted {inserted} transactions into {args.db}.")
     elif args.command == "export":
-        exported = export_rows(args.db, args.out, args.format)
+        exported = export_rows(args.db, args.out, args.format, args.limit)
         print(f"Exported {exported} rows to {args.out}.")
 
 